@@ -1,13 +1,146 @@
 import time
+import random
+import asyncio
 import logging
 import argparse
 import signal
 import sys
+import threading
 import ipaddress
+import math
+import re
 from datetime import datetime
-from functools import partial
 from urllib.parse import urlunparse
+import aiohttp
 import requests
+from pythonjsonlogger import jsonlogger
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # The stdlib module exposes the same loads/dumps used here
+    import json as orjson
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Stand-in for `numba.njit` that leaves the function as plain Python when numba is not installed.
+        """
+        return lambda func: func
+
+
+# Upper bound, in seconds, on a single retry delay
+MAX_BACKOFF = 60
+# Slack subtracted before rounding up a replica count, so float error such as 6 * 0.40 / 0.80 == 3.0000000000000004 does not add a replica
+_CEIL_EPSILON = 1e-9
+# HTTP statuses that are always retried; 413, 429 and 503 responses carrying Retry-After are retried as well
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Host names accepted in addition to IP addresses
+_SPECIAL_HOSTS = frozenset({"localhost", "host.docker.internal"})
+# Dotted-quad IPv4 address, checked before falling back to the ipaddress module
+_IPV4_RE = re.compile(r"(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)")
+
+
+@njit(cache=True)
+def decide(current_cpu, current_replicas, target, low, high, min_replicas, max_replicas):
+    """
+    Computes the replica count for a CPU usage reading.
+
+    Outside the hysteresis band, the replica count is scaled in proportion to how far CPU usage is from the target, so a single adjustment converges instead of
+    moving one replica per poll. This is a pure function of its arguments so it can be JIT-compiled with numba when available, and batched across many
+    services in the future.
+
+    Args:
+        current_cpu (float): The current CPU usage.
+        current_replicas (int): The current number of replicas.
+        target (float): The target CPU usage.
+        low (float): The CPU usage below which replicas are removed.
+        high (float): The CPU usage above which replicas are added.
+        min_replicas (int): The lowest replica count to request.
+        max_replicas (int): The highest replica count to request.
+
+    Returns:
+        int: The new number of replicas.
+    """
+    if low <= current_cpu <= high:
+        return current_replicas  # CPU usage is within the hysteresis band around the target
+    # Replicas needed to bring CPU usage back to the target, clamped to the configured range
+    desired = math.ceil(current_replicas * current_cpu / target - _CEIL_EPSILON)
+    return min(max_replicas, max(min_replicas, desired))
+
+
+class BackoffRetry(Retry):
+    """
+    A urllib3 retry policy that waits according to a custom backoff function.
+
+    urllib3 only supports a fixed backoff formula, so this subclass delegates the delay to the AutoScaler's full-jitter backoff and logs each retry. The
+    delay requested by a Retry-After header is capped as well, so a misbehaving server cannot stall the scaler.
+    """
+
+    def __init__(self, *args, backoff=None, max_backoff=MAX_BACKOFF, **kwargs):
+        """
+        Initializes the retry policy.
+
+        Parameters:
+            backoff (callable): Returns the delay, in seconds, for a given number of failed attempts.
+            max_backoff (int): The upper bound, in seconds, on the delay requested by a Retry-After header.
+        """
+        super().__init__(*args, **kwargs)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def new(self, **kw):
+        """
+        Creates the next retry state, carrying over the backoff settings that urllib3 does not know about.
+        """
+        retry = super().new(**kw)
+        retry.backoff = self.backoff
+        retry.max_backoff = self.max_backoff
+        return retry
+
+    def get_retry_after(self, response):
+        """
+        Gets the delay requested by the response's Retry-After header, capped at max_backoff.
+
+        Args:
+            response: The HTTP response that failed.
+
+        Returns:
+            float: The delay, in seconds, to wait before the next attempt, or
+            None: If the response has no Retry-After header.
+        """
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_backoff)
+
+    def get_backoff_time(self):
+        """
+        Computes the delay before the next attempt from the number of failed attempts so far.
+
+        Returns:
+            float: The delay, in seconds, to wait before the next attempt.
+        """
+        attempts = len(self.history)
+        if not attempts or self.backoff is None:
+            return 0
+        delay = self.backoff(attempts)
+        last = self.history[-1]
+        details = {"verb": last.method, "attempt": attempts, "delay": round(delay, 2)}
+        if last.status:
+            details["status"] = last.status
+        if last.error:
+            details["error"] = str(last.error)
+        logger.warning("retry", extra=details)
+        return delay
 
 
 class AutoScaler:
@@ -15,7 +148,7 @@ class AutoScaler:
     A class used to automatically scale an application based on CPU utilization.
     """
 
-    def __init__(self, host, port, use_https, target_cpu_usage, polling_interval, retry_count, retry_delay):
+    def __init__(self, host, port, use_https, target_cpu_usage, polling_interval, retry_count, retry_delay, max_backoff=MAX_BACKOFF, hysteresis=0.05, cooldown_period=60, min_replicas=1, max_replicas=None):
         """
         Initializes the AutoScaler with the given configuration.
 
@@ -27,74 +160,166 @@ class AutoScaler:
             polling_interval (int): The interval, in seconds, between checks.
             retry_count (int): The number of retries for failed requests.
             retry_delay (int): The delay, in seconds, between retries.
+            max_backoff (int): The upper bound, in seconds, on a single retry delay.
+            hysteresis (float): The fraction of the target CPU usage, on either side of it, within which no scaling happens.
+            cooldown_period (int): The time, in seconds, after a successful scaling request during which the application is not polled.
+            min_replicas (int): The lowest replica count to request.
+            max_replicas (int): The highest replica count to request, or None for no upper limit.
+
+        Raises:
+            ValueError: If min_replicas is below 1 or greater than max_replicas.
         """
+        # A target scaled to zero reports no CPU usage to scale back up from
+        if min_replicas < 1:
+            raise ValueError(f"min_replicas must be at least 1, got {min_replicas}")
+        if max_replicas is not None and min_replicas > max_replicas:
+            raise ValueError(f"min_replicas ({min_replicas}) must not be greater than max_replicas ({max_replicas})")
         self.host = host
         self.port = port
         self.use_https = use_https
         self.target_cpu_usage = target_cpu_usage
+        self.hysteresis = hysteresis
+        # CPU usage between these bounds is considered on target, so small oscillations do not flap the replica count
+        self._low = target_cpu_usage * (1 - hysteresis)
+        self._high = target_cpu_usage * (1 + hysteresis)
+        self.min_replicas = min_replicas
+        self.max_replicas = max_replicas
+        # decide() needs an integer bound, so no limit is represented by the largest native integer
+        self._max_replicas = sys.maxsize if max_replicas is None else max_replicas
         self.polling_interval = polling_interval
+        self.cooldown_period = cooldown_period
         self.retry_count = retry_count
         self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
+        self._backoffs = self._build_backoffs()
+        # Reuse a single keep-alive connection across polls instead of opening a new one per request
         self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        # Retries are handled by urllib3, which also honours Retry-After on 429/503; retry_count counts the first attempt. The asynchronous loop applies the
+        # same policy through _async_retry_delay
+        self._retry = BackoffRetry(
+            total=max(self.retry_count - 1, 0),
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=("GET", "PUT"),
+            raise_on_status=False,
+            respect_retry_after_header=True,
+            backoff=self.backoff_delay,
+            max_backoff=self.max_backoff,
+        )
+        self.session.mount(self.construct_url(""), HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=self._retry))
+        # Endpoint URLs are fixed for the lifetime of the instance, so build them once
+        self._status_url = self.construct_url("/app/status")
+        self._replicas_url = self.construct_url("/app/replicas")
+        self._json_hdr = {"Content-Type": "application/json"}
+        # Replica count of the last successful PUT, used to avoid re-sending an identical request while the application catches up.
+        # It is only trusted while the application still reports the count it had when the PUT was sent, and for a bounded time.
+        self._last_desired = None
+        self._last_desired_from = None
+        self._last_desired_until = 0.0
+        # Replica count reported by the most recent status
+        self._observed_replicas = None
+        # Monotonic time until which new replicas are still starting up and CPU readings are unreliable
+        self._cooldown_until = 0.0
         # If set to True, the run loop will execute only once (useful for testing)
         self.run_once = False
-        self.stop_requested = False
+        # Set to request a stop; waiting on it lets the polling sleep end as soon as a stop is requested
+        self._stop = threading.Event()
+        # Event loop counterpart of _stop, only present while run_async is running
+        self._stop_event = None
+        self._loop = None
+        # Monotonic time of the current poll on the fixed polling schedule
+        self._next_tick = None
+
+    @property
+    def stop_requested(self):
+        """
+        Indicates whether a stop has been requested for the auto-scaling process.
+        """
+        return self._stop.is_set()
 
     def construct_url(self, path):
         """
         Constructs the complete URL based on the host, port, and HTTPS setting.
+
+        The status and replicas URLs are built once in `__init__`; this method remains available for building other endpoint URLs.
         """
         scheme = "https" if self.use_https else "http"
         hostport = f"{self.host}:{self.port}"
         return urlunparse((scheme, hostport, path, "", "", ""))
 
+    def _build_backoffs(self):
+        """
+        Precomputes the exponential backoff ceiling for every retry attempt.
+
+        Each delay is the previous one multiplied by `retry_delay` (at least 2, so a `retry_delay` of 1 still grows), starting at `retry_delay` and capped at `max_backoff`.
+        Growth stops at the cap, so large retry counts or delays cannot produce huge sleeps.
+
+        Returns:
+            list: The backoff ceiling, in seconds, for attempts 1 through `retry_count`.
+        """
+        backoffs = []
+        delay = min(self.retry_delay, self.max_backoff)
+        growth = max(self.retry_delay, 2)
+        for _ in range(self.retry_count):
+            backoffs.append(delay)
+            delay = min(delay * growth, self.max_backoff)
+        return backoffs
+
+    def backoff_delay(self, attempts):
+        """
+        Computes the delay before the next retry using exponential backoff with full jitter.
+
+        The delay is drawn uniformly between zero and the precomputed exponential backoff value for the attempt, so that concurrent clients failing together do not retry in lockstep.
+
+        Args:
+            attempts (int): The number of attempts made so far.
+
+        Returns:
+            float: The delay, in seconds, to wait before the next attempt.
+        """
+        # Jitter does not need a cryptographically secure generator
+        return random.uniform(0, self._backoffs[attempts - 1])  # nosec B311
+
     def get_current_status(self):
         """
         Retrieves the current status of the application including CPU usage and replica count.
 
-        The method makes an HTTP GET request to the application's status endpoint. If the request fails, it retries a specified number of times with an exponential backoff delay between
-        attempts. The response is expected to contain the current CPU usage and the number of replicas in a JSON format.
+        The method makes an HTTP GET request to the application's status endpoint. Failed requests are retried by the session's retry adapter with an exponential
+        backoff delay between attempts. The response is expected to contain the current CPU usage and the number of replicas in a JSON format.
 
         Returns:
             dict: A dictionary containing the current CPU usage and replica count, or
             None: If the request fails or an error occurs after all retry attempts.
         """
-        attempts = 0
-        while attempts < self.retry_count:
+        try:
+            # Make the HTTP GET request to the application's status endpoint
+            response = self.session.get(self._status_url, timeout=5)
+        except requests.exceptions.RequestException as e:
+            # Log an error if a request exception occurs (e.g., network issues) after all retry attempts
+            logger.error("request failed", extra={"verb": "GET", "error": str(e)})
+            return None
+
+        # Check if the response is successful (HTTP 200 OK)
+        if response.status_code == 200:
+            # Return the JSON response containing the status
             try:
-                # Make the HTTP GET request to the application's status endpoint
-                response = requests.get(self.construct_url("/app/status"), headers={"Accept": "application/json"}, timeout=5)
-
-                # Check if the response is successful (HTTP 200 OK)
-                if response.status_code == 200:
-                    # Return the JSON response containing the status
-                    return response.json()
-                else:
-                    # Log an error if the response status code indicates a failure
-                    logging.error(f"HTTP Verb: {response.request.method}, HTTP Status: {response.status_code}, HTTP Message: {response.text.strip()}")
-
-            except requests.exceptions.RequestException as e:
-                # Log an error if a request exception occurs (e.g., network
-                # issues)
-                logging.error("Request error: %s", e)
-
-            # Increment the number of attempts and apply an exponential backoff for retries
-            attempts += 1
-            logging.error(f"HTTP Verb: GET, Retry (in seconds): {self.retry_delay**attempts}, Attempt #: {attempts}")
-            time.sleep(self.retry_delay**attempts)
-
-        # Return None if all retry attempts fail
+                return orjson.loads(response.content)
+            except ValueError as e:
+                # A body that is not JSON, such as an error page served by a proxy, is a failed request rather than a crash
+                logger.error("request failed", extra={"verb": "GET", "status": 200, "error": str(e) or type(e).__name__})
+                return None
+
+        # Log an error if the response status code indicates a failure, decoding the body only if the record will be emitted
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("request failed", extra={"verb": "GET", "status": response.status_code, "body": response.text.strip()})
         return None
 
     def set_replica_count(self, new_count):
         """
         Sets the number of replicas for the application based on the current CPU usage.
 
-        Parameters:
-            new_count (int): The new number of replicas to set.
-
-        This method attempts to update the number of replicas for the application by making HTTP PUT requests to the application's replicas endpoint.
-        It uses an exponential backoff retry mechanism to handle failures.
+        This method updates the number of replicas for the application by making an HTTP PUT request to the application's replicas endpoint.
+        Failed requests are retried by the session's retry adapter with an exponential backoff with full jitter.
 
         Args:
             new_count (int): The desired number of replicas to be set.
@@ -102,78 +327,374 @@ class AutoScaler:
         Returns:
             None: If the request fails or an error occurs.
         """
-        success = False
+        try:
+            # Make the HTTP PUT request
+            response = self.session.put(self._replicas_url, data=orjson.dumps({"replicas": new_count}), headers=self._json_hdr, timeout=5)
+        except requests.exceptions.RequestException as e:
+            # Handle request exceptions (e.g., network issues) after all retry attempts
+            logger.error("request failed", extra={"verb": "PUT", "error": str(e)})
+            return
+
+        # Check the response status code
+        if response.status_code == 204:
+            self._record_scaled(new_count)
+        elif logger.isEnabledFor(logging.ERROR):
+            logger.error("request failed", extra={"verb": "PUT", "status": response.status_code, "body": response.text.strip()})
+
+    async def _get_status_async(self, session, limit):
+        """
+        Retrieves the current status of the application without blocking the event loop.
+
+        This is the asynchronous counterpart of `get_current_status` and applies the same retry policy, backoff, and Retry-After handling as the session's
+        retry adapter.
+
+        Args:
+            session (aiohttp.ClientSession): The session used to make the request.
+            limit (asyncio.Semaphore): Bounds the number of requests in flight; it is held only while a request is pending, not during backoff.
+
+        Returns:
+            dict: A dictionary containing the current CPU usage and replica count, or
+            None: If the request fails or an error occurs after all retry attempts.
+        """
         attempts = 0
-        while not success and attempts < self.retry_count:
+        while True:
+            status = retry_after = None
             try:
-                # Prepare data for the PUT request
-                data = {"replicas": new_count}
+                async with limit, session.get(self._status_url) as response:
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    status, retry_after = response.status, response.headers.get("Retry-After")
+                    failure = {"status": status}
+                    # Decode the body only if the failure will be logged
+                    if logger.isEnabledFor(logging.WARNING):
+                        failure["body"] = (await response.text()).strip()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                failure = {"error": str(e) or type(e).__name__}
+            except ValueError as e:
+                # A 200 response whose body is not JSON, such as an error page served by a proxy, is retried like a transient error
+                failure = {"status": 200, "error": str(e) or type(e).__name__}
 
-                # Make the HTTP PUT request
-                response = requests.put(self.construct_url("/app/replicas"), json=data, headers={"Content-Type": "application/json"}, timeout=5)
+            attempts += 1
+            delay = self._async_retry_delay("GET", attempts, status, retry_after)
+            if delay is None:
+                logger.error("request failed", extra={"verb": "GET", "attempt": attempts, **failure})
+                return None
+            # Log the failure and the upcoming retry as a single record
+            logger.warning("retry", extra={"verb": "GET", "attempt": attempts, "delay": round(delay, 2), **failure})
+            if await self._wait_for_stop(delay):
+                return None
+
+    async def _set_replicas_async(self, session, limit, new_count):
+        """
+        Sets the number of replicas for the application without blocking the event loop.
 
-                # Check the response status code
-                if response.status_code == 204:
-                    success = True
-                    return
-                else:
-                    logging.error(f"HTTP Verb: {response.request.method}, HTTP Status: {response.status_code}, HTTP Message: {response.text.strip()}")
+        This is the asynchronous counterpart of `set_replica_count` and applies the same retry policy, backoff, and Retry-After handling as the session's
+        retry adapter.
 
-            except requests.exceptions.RequestException as e:
-                # Handle request exceptions (e.g., network issues)
-                logging.error("Request error: %s", e)
+        Args:
+            session (aiohttp.ClientSession): The session used to make the request.
+            limit (asyncio.Semaphore): Bounds the number of requests in flight; it is held only while a request is pending, not during backoff.
+            new_count (int): The desired number of replicas to be set.
+        """
+        attempts = 0
+        data = orjson.dumps({"replicas": new_count})
+        while True:
+            status = retry_after = None
+            try:
+                async with limit, session.put(self._replicas_url, data=data, headers=self._json_hdr) as response:
+                    if response.status == 204:
+                        self._record_scaled(new_count)
+                        return
+                    status, retry_after = response.status, response.headers.get("Retry-After")
+                    failure = {"status": status}
+                    # Decode the body only if the failure will be logged
+                    if logger.isEnabledFor(logging.WARNING):
+                        failure["body"] = (await response.text()).strip()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                failure = {"error": str(e) or type(e).__name__}
 
-            # Increment retry attempts and log details
             attempts += 1
-            logging.error(f"HTTP Verb: PUT, Retry (in seconds): {self.retry_delay**attempts}, Attempt #: {attempts}")
+            delay = self._async_retry_delay("PUT", attempts, status, retry_after)
+            if delay is None:
+                logger.error("request failed", extra={"verb": "PUT", "attempt": attempts, **failure})
+                return
+            # Log the failure and the upcoming retry as a single record
+            logger.warning("retry", extra={"verb": "PUT", "attempt": attempts, "delay": round(delay, 2), **failure})
+            if await self._wait_for_stop(delay):
+                return
+
+    def _async_retry_delay(self, verb, attempts, status, retry_after):
+        """
+        Decides whether a failed asynchronous request is retried, following the same policy as the session's retry adapter.
+
+        Connection errors and timeouts are retried, as are the statuses in RETRY_STATUSES. A 413, 429 or 503 response carrying a Retry-After header is also
+        retried, after the delay the header asks for capped at max_backoff; other failures wait for the full-jitter backoff. Any other status, such as a 4xx
+        client error, is not retried.
+
+        Args:
+            verb (str): The HTTP method of the failed request.
+            attempts (int): The number of attempts made so far, including the failed one.
+            status (int): The HTTP status of the failed response, or None if no response was received.
+            retry_after (str): The Retry-After header of the failed response, or None if it was absent.
+
+        Returns:
+            float: The delay, in seconds, to wait before the next attempt, or
+            None: If the request should not be retried.
+        """
+        if attempts >= self.retry_count:
+            return None
+        if status is not None:
+            if not self._retry.is_retry(verb, status, has_retry_after=retry_after is not None):
+                return None
+            if retry_after is not None:
+                try:
+                    return min(self._retry.parse_retry_after(retry_after), self.max_backoff)
+                except InvalidHeader:
+                    # Fall back to the backoff, as a malformed header gives no usable delay
+                    pass
+        return self.backoff_delay(attempts)
+
+    async def _wait_for_stop(self, delay):
+        """
+        Waits for the given delay without blocking the event loop, returning early if a stop is requested.
+
+        Args:
+            delay (float): The time, in seconds, to wait.
+
+        Returns:
+            bool: True if a stop was requested, False if the delay elapsed.
+        """
+        if self._stop_event is None:
+            # Called outside run_with_session, so there is no event to wake on
+            await asyncio.sleep(delay)
+            return self._stop.is_set()
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _record_scaled(self, new_count):
+        """
+        Records a successful scaling request and starts the cooldown period.
+
+        The requested count is remembered as pending until the application reports a different replica count than it did when the request was sent, or until
+        one polling interval after the cooldown has elapsed, whichever comes first.
+
+        Args:
+            new_count (int): The replica count that was set.
+        """
+        now = time.monotonic()
+        self._last_desired = new_count
+        self._last_desired_from = self._observed_replicas
+        self._last_desired_until = now + self.cooldown_period + self.polling_interval
+        self._cooldown_until = now + self.cooldown_period
+
+    def plan_adjustment(self, status):
+        """
+        Decides the replica count to request based on an application status.
+
+        Args:
+            status (dict): The status returned by the application, containing the CPU usage and replica count.
+
+        Returns:
+            int: The new number of replicas to set, or
+            None: If no change is needed or the same change has already been requested.
+        """
+        # Current CPU usage
+        current_cpu = status["cpu"]["highPriority"]
+        # Current number of replicas
+        current_replicas = status["replicas"]
+        self._observed_replicas = current_replicas
+
+        # Forget the pending request once the application has moved off the count it reported when the request was sent (it reached the requested count or
+        # was changed elsewhere), or once the application has had time to apply it
+        if self._last_desired is not None and (current_replicas != self._last_desired_from or time.monotonic() >= self._last_desired_until):
+            self._last_desired = None
+
+        # Calculate the necessary adjustment based on CPU usage, ignoring changes within the hysteresis band
+        new_replicas = decide(current_cpu, current_replicas, self.target_cpu_usage, self._low, self._high, self.min_replicas, self._max_replicas)
+
+        # Log the current status and any adjustments made
+        logger.info("iteration", extra={"cpu": current_cpu, "replicas": current_replicas, "new_replicas": new_replicas})
+
+        # Only request a change that differs from the current count and is not already pending
+        if new_replicas != current_replicas and new_replicas != self._last_desired:
+            return new_replicas
+        return None
+
+    def in_cooldown(self):
+        """
+        Checks whether the AutoScaler is in the cooldown period that follows a successful scaling request.
+
+        While replicas are starting, CPU readings do not yet reflect the new capacity and acting on them could scale twice, so polls are skipped until the
+        cooldown period has elapsed.
+
+        Returns:
+            bool: True if the cooldown period has not yet elapsed, False otherwise.
+        """
+        remaining = self._cooldown_until - time.monotonic()
+        if remaining > 0:
+            logger.info("cooldown", extra={"remaining": round(remaining, 2)})
+            return True
+        return False
+
+    def _time_until_next_poll(self):
+        """
+        Advances the polling schedule by one interval and returns the time left until the next poll.
 
-            # Apply exponential backoff delay before the next retry
-            time.sleep(self.retry_delay**attempts)
+        Polls are kept on a fixed grid of `polling_interval` seconds measured with a monotonic clock, so request latency does not accumulate as drift. If the
+        scaler has fallen more than a full interval behind, the schedule restarts from now instead of issuing a burst of catch-up polls.
+
+        Returns:
+            float: The number of seconds to wait before the next poll, or 0 if it is already due.
+        """
+        self._next_tick += self.polling_interval
+        now = time.monotonic()
+        remaining = self._next_tick - now
+        if remaining <= 0:
+            self._next_tick = now
+            return 0
+        return remaining
 
     def run(self):
         """
         Starts the auto-scaling process. Continuously monitors the application and adjusts the number of replicas based on the CPU usage.
 
-        This method runs in a loop, checking the application's status at each polling interval and adjusting the number of replicas to maintain the target CPU usage.
+        This method runs in a loop, checking the application's status on a fixed schedule of one poll per polling interval and adjusting the number of replicas to maintain the target CPU usage.
         The method retrieves the current CPU usage and the number of replicas from the application, calculates whether an adjustment is needed, and sets the new number of replicas if necessary.
-        The loop continues until the `stop_requested` flag is set to True. If `run_once` is set to True, the loop runs only once, which is useful for testing purposes.
+        The loop continues until a stop is requested via `request_stop`, which also interrupts the wait between polls. If `run_once` is set to True, the loop runs only once, which is useful for testing purposes.
         """
-        while not self.stop_requested:
-            status = self.get_current_status()  # Get current status of the application
+        self._next_tick = time.monotonic()
+        while not self._stop.is_set():
+            # Get current status of the application, unless replicas are still starting after the last change
+            status = None if self.in_cooldown() else self.get_current_status()
             if status:
-                # Current CPU usage
-                current_cpu = status["cpu"]["highPriority"]
-                # Current number of replicas
-                current_replicas = status["replicas"]
-                new_replicas = current_replicas  # Initialize new_replicas
-
-                # Calculate the necessary adjustment based on CPU usage
-                if current_cpu < self.target_cpu_usage:
-                    new_replicas = max(1, current_replicas - 1)  # Decrease replicas if CPU usage is below target
-                if current_cpu > self.target_cpu_usage:
-                    new_replicas = current_replicas + 1  # Increase replicas if CPU usage is above target
-
-                # Log the current status and any adjustments made
-                logging.info(f"Current CPU: {current_cpu}, Current Replicas: {current_replicas}, New Replicas: {new_replicas}")
-
-                # Update the number of replicas if there is a change
-                if new_replicas != current_replicas:
+                new_replicas = self.plan_adjustment(status)
+                if new_replicas is not None:
                     self.set_replica_count(new_replicas)
 
             # Break the loop if run_once is set (useful for testing)
             if self.run_once:
                 break
 
-            # Wait for the specified polling interval before the next check
-            time.sleep(self.polling_interval)
+            # Wait until the next scheduled check, returning early if a stop is requested
+            if self._stop.wait(self._time_until_next_poll()):
+                break
+
+    async def run_async(self):
+        """
+        Starts the auto-scaling process on an asyncio event loop.
+
+        This method behaves like `run`, but performs HTTP requests with a single keep-alive `aiohttp.ClientSession` and waits with `asyncio` primitives, so
+        the event loop stays free while requests, retries, and polling intervals are pending. The loop exits as soon as `request_stop` is called.
+        """
+        async with client_session(4) as session:
+            # A single target never has more than one request in flight
+            await self.run_with_session(session, asyncio.Semaphore(1))
+
+    async def run_with_session(self, session, limit):
+        """
+        Runs the asynchronous auto-scaling loop using a session and request limit that may be shared with other AutoScaler instances.
+
+        An error raised while handling one poll, such as a status missing the expected fields, is logged and the loop continues with the next poll.
+
+        Args:
+            session (aiohttp.ClientSession): The session used to make requests.
+            limit (asyncio.Semaphore): Bounds the number of requests in flight across everything sharing it.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        if self._stop.is_set():
+            self._stop_event.set()
+
+        try:
+            self._next_tick = time.monotonic()
+            while not self._stop_event.is_set():
+                try:
+                    status = None if self.in_cooldown() else await self._get_status_async(session, limit)
+                    if status:
+                        new_replicas = self.plan_adjustment(status)
+                        if new_replicas is not None:
+                            await self._set_replicas_async(session, limit, new_replicas)
+                except Exception:
+                    # A malformed status must not end this loop, nor the loops of other targets sharing the event loop
+                    logger.exception("iteration failed", extra={"url": self._status_url})
+
+                # Break the loop if run_once is set (useful for testing)
+                if self.run_once:
+                    break
+
+                # Wait until the next scheduled poll, returning early if a stop is requested
+                if await self._wait_for_stop(self._time_until_next_poll()):
+                    break
+        finally:
+            self._stop_event = None
+            self._loop = None
 
     def request_stop(self):
         """
         Requests the auto-scaling process to stop.
 
-        This method sets a flag that will cause the main loop in the 'run' method to exit at the end of its current iteration.
+        This method sets an event that will cause the main loop in the 'run' method to exit at the end of its current iteration, interrupting the wait between polls.
         """
-        self.stop_requested = True
+        self._stop.set()
+        # Wake run_async as well; the event loop may be running in another thread
+        loop, stop_event = self._loop, self._stop_event
+        if loop is not None and stop_event is not None:
+            loop.call_soon_threadsafe(stop_event.set)
+
+
+class MultiAutoScaler:
+    """
+    A class used to automatically scale several applications from a single process.
+
+    Each target is an AutoScaler holding its own configuration. All targets are polled concurrently on one asyncio event loop and share one HTTP connection
+    pool, with a semaphore bounding the number of requests in flight at any time.
+    """
+
+    def __init__(self, targets, concurrency=4):
+        """
+        Initializes the MultiAutoScaler with the given targets.
+
+        Parameters:
+            targets (list): The AutoScaler instances, one per application to be scaled.
+            concurrency (int): The maximum number of HTTP requests in flight across all targets.
+        """
+        self.targets = list(targets)
+        self.concurrency = concurrency
+
+    async def run(self):
+        """
+        Starts the auto-scaling process for every target and runs until all of them have stopped.
+        """
+        limit = asyncio.Semaphore(self.concurrency)
+        async with client_session(self.concurrency) as session:
+            await asyncio.gather(*(target.run_with_session(session, limit) for target in self.targets))
+
+    def request_stop(self):
+        """
+        Requests the auto-scaling process to stop for every target.
+        """
+        for target in self.targets:
+            target.request_stop()
+
+
+def client_session(connection_limit):
+    """
+    Creates the aiohttp session used by the asynchronous auto-scaling loops.
+
+    Args:
+        connection_limit (int): The maximum number of pooled connections.
+
+    Returns:
+        aiohttp.ClientSession: A keep-alive session that requests JSON and times out requests after 5 seconds.
+    """
+    connector = aiohttp.TCPConnector(limit=connection_limit, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=5)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, headers={"Accept": "application/json"})
 
 
 class ValidatePortAction(argparse.Action):
@@ -212,16 +733,22 @@ def parse_arguments():
     This function defines the command-line arguments that the AutoScaler accepts, processes the arguments provided by the user, and returns them in a structured
     format for use in the application.
 
-    The function also validates the application URL argument to ensure it's a well-formed URL with a valid IP address and port.
+    The function also validates the application URL argument to ensure it's a well-formed URL with a valid IP address and port, and that the replica
+    range is not empty and does not allow scaling to zero.
 
     Returns:
         argparse.Namespace: An object containing the parsed command-line arguments.
     """
     parser = argparse.ArgumentParser(description="Auto-scaler for adjusting the number of replicas based on CPU utilization.")
     parser.add_argument("-tcu", "--target-cpu-usage", type=float, default=0.80, help="Target CPU usage to maintain (default: 0.80)")
+    parser.add_argument("-hy", "--hysteresis", type=float, default=0.05, help="Fraction of the target CPU usage within which no scaling happens (default: 0.05)")
+    parser.add_argument("-mnr", "--min-replicas", type=int, default=1, help="Lowest number of replicas to scale to (default: 1)")
+    parser.add_argument("-mxr", "--max-replicas", type=int, default=None, help="Highest number of replicas to scale to (default: no limit)")
     parser.add_argument("-pi", "--polling-interval", type=int, default=15, help="Seconds between polling (default: 15)")
+    parser.add_argument("-cp", "--cooldown-period", type=int, default=60, help="Seconds to skip polling after a successful scaling request (default: 60)")
     parser.add_argument("-rc", "--retry-count", type=int, default=6, help="Number of retries on failure (default: 6)")
     parser.add_argument("-rd", "--retry-delay", type=int, default=2, help="Seconds between retries (default: 2)")
+    parser.add_argument("-mb", "--max-backoff", type=int, default=MAX_BACKOFF, help=f"Maximum seconds to wait between retries (default: {MAX_BACKOFF})")
     parser.add_argument("-ip", "--host", type=str, default="localhost", help="Host of the application (default: localhost)")
     parser.add_argument("-p", "--port", type=int, default=8123, action=ValidatePortAction, help="Port of the application (default: 8123)")
     parser.add_argument("--https", action="store_true", help="Enable HTTPS for the application")
@@ -229,7 +756,15 @@ def parse_arguments():
     args = parser.parse_args()
 
     if not is_valid_ip_address(args.host):
-        logging.error(f"Invalid IP address provided.")
+        logger.error("Invalid IP address provided.")
+        sys.exit(1)
+
+    if args.min_replicas < 1:
+        logger.error("Minimum replicas must be at least 1.")
+        sys.exit(1)
+
+    if args.max_replicas is not None and args.min_replicas > args.max_replicas:
+        logger.error("Minimum replicas must not be greater than maximum replicas.")
         sys.exit(1)
 
     return args
@@ -245,8 +780,19 @@ def is_valid_ip_address(ip):
     Returns:
         bool: True if the IP address or 'localhost' or 'host.docker.internal' is valid, False otherwise.
     """
-    if ip == "localhost" or ip == "host.docker.internal":
-        return True
+    return ip in _SPECIAL_HOSTS or bool(_IPV4_RE.fullmatch(ip)) or _try_ipaddress(ip)
+
+
+def _try_ipaddress(ip):
+    """
+    Validates an address with the ipaddress module, which also covers IPv6.
+
+    Args:
+        ip (str): The IP address to validate.
+
+    Returns:
+        bool: True if the IP address is valid, False otherwise.
+    """
     try:
         ipaddress.ip_address(ip)
         return True
@@ -270,14 +816,49 @@ def handle_sigterm(signum, frame, auto_scaler):
     auto_scaler.request_stop()
 
 
+def json_log_handler():
+    """
+    Creates the log handler used by the AutoScaler application.
+
+    Every record is written as a single JSON object per line, with any `extra` fields (such as the CPU usage and replica counts of each iteration) as keys of
+    their own, so log shippers can ingest the records without parsing free-form messages.
+
+    Returns:
+        logging.Handler: A stream handler with a JSON formatter.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(message)s", datefmt="%Y-%m-%dT%H:%M:%S"))
+    return handler
+
+
+async def serve(auto_scaler):
+    """
+    Runs the AutoScaler on the current event loop until it is stopped.
+
+    The SIGTERM handler is registered with the event loop rather than with `signal.signal`, so the signal wakes the loop immediately instead of waiting for the next
+    Python bytecode boundary in the main thread. The handler is the AutoScaler's own `request_stop`, which needs no wrapper.
+
+    Args:
+        auto_scaler (AutoScaler): An instance of AutoScaler to run.
+    """
+    loop = asyncio.get_running_loop()
+    # Set up a signal handler for gracefully handling SIGTERM signals
+    loop.add_signal_handler(signal.SIGTERM, auto_scaler.request_stop)
+    try:
+        await auto_scaler.run_async()
+    finally:
+        loop.remove_signal_handler(signal.SIGTERM)
+
+
 def main():
     """
     Main function to initialize and run the AutoScaler application.
 
     This function sets up logging with a specified format and logging level. It parses command-line arguments to configure the AutoScaler instance.
-    After parsing the arguments, it creates an AutoScaler instance and sets up a signal handler for graceful shutdown upon receiving a SIGTERM signal.
+    After parsing the arguments, it creates an AutoScaler instance and runs it on an asyncio event loop with a signal handler for graceful shutdown upon receiving a SIGTERM signal.
     The function starts the auto-scaling process and keeps it running until it's interrupted by a keyboard interrupt (Ctrl+C) or a SIGTERM signal.
 
+    Command-line arguments are parsed and validated before the AutoScaler is created, so invalid arguments exit without setting up an HTTP session.
     Upon receiving a keyboard interrupt, the function requests the AutoScaler to stop its operation gracefully.
     """
 
@@ -287,41 +868,36 @@ def main():
     try:
         start_time = datetime.now()
         # Configure logging with a specific format and level
-        logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%dT%H:%M:%S")
-        logging.info("AutoScaler started")
-        # Initialize auto_scaler to None
-        args = parse_arguments()
+        logging.basicConfig(level=logging.INFO, handlers=[json_log_handler()])
 
-        
-        # Parse command-line arguments for the AutoScaler configuration
-        auto_scaler = AutoScaler(args.host, args.port, args.https, args.target_cpu_usage, args.polling_interval, args.retry_count, args.retry_delay)
+        # Parse and validate command-line arguments before allocating the AutoScaler and its HTTP session, so invalid arguments exit early
+        args = parse_arguments()
 
-        # Set up a signal handler for gracefully handling SIGTERM signals
-        signal.signal(signal.SIGTERM, partial(handle_sigterm, auto_scaler=auto_scaler))
+        auto_scaler = AutoScaler(args.host, args.port, args.https, args.target_cpu_usage, args.polling_interval, args.retry_count, args.retry_delay, args.max_backoff, args.hysteresis, args.cooldown_period, args.min_replicas, args.max_replicas)
+        logger.info("AutoScaler started")
 
-        # Start the auto-scaling process
-        auto_scaler.run()
+        # Start the auto-scaling process on an event loop
+        asyncio.run(serve(auto_scaler))
 
     except KeyboardInterrupt:
         # Handle keyboard interrupt (Ctrl+C) and request a graceful shutdown of the AutoScaler
-        logging.info(f"Stopping AutoScaler...")
-        auto_scaler.request_stop()
+        logger.info("Stopping AutoScaler...")
     # except Exception as e:
     #     # Handle keyboard interrupt (Ctrl+C) and request a graceful shutdown of the AutoScaler
     #     logging.info(f"Expection raised. Reason: {e}")
     #     auto_scaler.request_stop()
     except SystemExit as e:
         # Log an error message for invalid arguments
-        logging.error(f"Invalid arguments provided. Exiting with code {e.code}.")
+        logger.error("Invalid arguments provided. Exiting with code %s.", e.code)
 
     finally:
+        # Only report a shutdown if the AutoScaler was actually started
         if auto_scaler is not None:
             auto_scaler.request_stop()
-        logging.info(f"AutoScaler Stopped")
-        
-        shutdown_time = datetime.now()
-        logging.info(f"Started at: {start_time.isoformat()}, Shutdown at: {shutdown_time.isoformat()}, Uptime: {shutdown_time - start_time}")
-        
+            logger.info("AutoScaler Stopped")
+
+            shutdown_time = datetime.now()
+            logger.info("Started at: %s, Shutdown at: %s, Uptime: %s", start_time.isoformat(), shutdown_time.isoformat(), shutdown_time - start_time)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,21 @@
 import os
 import sys
+import json
+import logging
 import signal
+import asyncio
+import threading
+import time
 import pytest
-from autoscaler import AutoScaler, handle_sigterm
-from unittest.mock import Mock, patch
+import requests_mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from autoscaler import AutoScaler, MultiAutoScaler, decide, handle_sigterm
+from unittest.mock import ANY, patch
 from functools import partial
-from autoscaler import parse_arguments
+from types import SimpleNamespace
+from autoscaler import client_session, is_valid_ip_address, json_log_handler, parse_arguments
 
 
 class MockConfig:
@@ -45,78 +55,391 @@ def mock_config():
     return MockConfig("localhost", 8123, False, 0.80, 15, 3, 2)
 
 
-@pytest.mark.parametrize("cpu_usage", [i / 100 for i in range(0, 101)])
-def test_auto_scaler_adjustment(mocker, mock_config, cpu_usage):
+@pytest.fixture
+def http_adapter():
+    """
+    Provides a pytest fixture for a requests-mock transport adapter.
+
+    Tests register the responses of the emulated application on this adapter and inspect the requests it received.
+
+    Returns:
+        requests_mock.Adapter: An adapter with no registered responses.
+    """
+    return requests_mock.Adapter()
+
+
+@pytest.fixture
+def auto_scaler(mock_config, http_adapter):
+    """
+    Provides a pytest fixture for an AutoScaler whose HTTP session is served by the requests-mock adapter.
+
+    The adapter replaces the session's transport for the application's base URL, so requests never reach the network and no per-test patching is needed.
+
+    Returns:
+        AutoScaler: An AutoScaler configured from the mock configuration.
+    """
+    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay)
+    auto_scaler.session.mount(auto_scaler.construct_url(""), http_adapter)
+    return auto_scaler
+
+
+@pytest.mark.parametrize("cpu_usage, current_replicas, expected_replicas", [
+    # Edges of the 5% hysteresis band around the 0.80 target, and just outside it
+    (0.76, 10, 10), (0.84, 10, 10), (0.75, 20, 19), (0.85, 20, 22), (0.85, 1, 2),
+    # On target, and at multiples of the target where float error could round up an extra replica
+    (0.80, 3, 3), (0.80, 12, 12), (0.40, 6, 3), (0.20, 12, 3), (0.40, 10, 5), (0.60, 4, 3), (1.20, 4, 6), (1.60, 2, 4),
+    # Clamped to the replica range
+    (0.0, 10, 1), (0.10, 8, 1), (5.0, 500, 1000),
+])
+def test_decide_across_cpu_range(cpu_usage, current_replicas, expected_replicas):
+    """
+    Test the pure replica decision function against known replica counts across the CPU usage range, without running the polling loop.
+
+    Args:
+        cpu_usage (float): Simulated CPU usage value for the test.
+        current_replicas (int): Simulated current replica count.
+        expected_replicas (int): The expected new replica count.
+    """
+    assert decide(cpu_usage, current_replicas, 0.80, 0.80 * 0.95, 0.80 * 1.05, 1, 1000) == expected_replicas
+
+
+@pytest.mark.parametrize("cpu_usage, expected_replicas", [(0.0, 1), (0.30, 1), (0.50, 2), (0.75, 2), (0.80, 2), (0.85, 3), (1.0, 3), (1.60, 4)])
+def test_auto_scaler_adjustment(auto_scaler, http_adapter, cpu_usage, expected_replicas):
     """
     Test the AutoScaler's ability to adjust the number of replicas based on CPU usage.
-    The test simulates different CPU usage scenarios and checks if the AutoScaler appropriately adjusts the number of replicas.
+    The test simulates different CPU usage scenarios with 2 replicas and checks if the AutoScaler appropriately adjusts the number of replicas.
 
     Args:
-        mocker: Pytest fixture for mocking.
-        mock_config: Mock configuration object for the AutoScaler.
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
         cpu_usage (float): Simulated CPU usage value for the test.
+        expected_replicas (int): The expected replica count after the iteration.
     """
     # Setup initial conditions
-    current_replicas = 1
-    expected_replicas = current_replicas
-
-    # Create an AutoScaler instance with mock configuration
-    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay)
-    constructed_url = auto_scaler.construct_url("/app/replicas")
+    current_replicas = 2
 
-    # Mock the responses for the HTTP requests
-    mocker.patch("requests.get", return_value=Mock(status_code=200, json=lambda: {"cpu": {"highPriority": cpu_usage}, "replicas": current_replicas}))
-    mock_put = mocker.patch("requests.put", return_value=Mock(status_code=204))
+    # Emulate the application's responses
+    http_adapter.register_uri("GET", "/app/status", json={"cpu": {"highPriority": cpu_usage}, "replicas": current_replicas})
+    put = http_adapter.register_uri("PUT", "/app/replicas", status_code=204)
 
     # Run the auto-scaling process once
     auto_scaler.run_once = True
     auto_scaler.run()
 
-    # Determine the expected number of replicas based on the simulated CPU usage
-    if cpu_usage == 0.80:
-        expected_replicas = current_replicas
-    elif cpu_usage < 0.80:
-        expected_replicas = max(1, current_replicas - 1)
-    else:
-        expected_replicas = current_replicas + 1
-
     if expected_replicas != current_replicas:
-        mock_put.assert_called_with(constructed_url, json={"replicas": expected_replicas}, headers={"Content-Type": "application/json"}, timeout=5)
+        assert put.call_count == 1
+        assert put.last_request.url == auto_scaler.construct_url("/app/replicas")
+        assert put.last_request.headers["Content-Type"] == "application/json"
+        assert put.last_request.json() == {"replicas": expected_replicas}
     else:
-        mock_put.assert_not_called()
+        assert not put.called
+
+
+@pytest.mark.parametrize("cpu_usage, expected_replicas", [(0.50, 2), (0.77, None), (0.80, None), (0.83, None), (0.90, 4)])
+def test_auto_scaler_hysteresis(mock_config, cpu_usage, expected_replicas):
+    """
+    Test that the AutoScaler leaves the replica count unchanged while CPU usage stays within the hysteresis band around the target.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+        cpu_usage (float): Simulated CPU usage value for the test.
+        expected_replicas (int): The expected new replica count, or None if no change is expected.
+    """
+    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay, hysteresis=0.05)
+    assert auto_scaler.plan_adjustment({"cpu": {"highPriority": cpu_usage}, "replicas": 3}) == expected_replicas
+
+
+@pytest.mark.parametrize("cpu_usage, current_replicas, expected_replicas", [(1.0, 4, 5), (1.0, 2, 3), (0.40, 10, 5), (0.40, 6, 3), (0.0, 10, 2), (5.0, 10, 20), (0.10, 4, 2)])
+def test_auto_scaler_scales_proportionally(mock_config, cpu_usage, current_replicas, expected_replicas):
+    """
+    Test that the AutoScaler requests the replica count needed to bring CPU usage back to target in one step, clamped to the configured range.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+        cpu_usage (float): Simulated CPU usage value for the test.
+        current_replicas (int): Simulated current replica count.
+        expected_replicas (int): The expected new replica count.
+    """
+    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay, min_replicas=2, max_replicas=20)
+    assert auto_scaler.plan_adjustment({"cpu": {"highPriority": cpu_usage}, "replicas": current_replicas}) == expected_replicas
+
+
+@pytest.mark.parametrize("min_replicas, max_replicas", [(0, None), (-1, 5), (6, 5)])
+def test_auto_scaler_rejects_invalid_replica_range(mock_config, min_replicas, max_replicas):
+    """
+    Test that the AutoScaler rejects a minimum replica count below 1 or above the maximum.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+        min_replicas (int): The configured minimum replica count.
+        max_replicas (int): The configured maximum replica count.
+    """
+    with pytest.raises(ValueError):
+        AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay, min_replicas=min_replicas, max_replicas=max_replicas)
+
+
+def test_auto_scaler_skips_repeated_put(auto_scaler, http_adapter):
+    """
+    Test that the AutoScaler does not re-send a replica count it has already set successfully.
+    The test simulates the application still reporting the old replica count after a successful PUT and checks that the same count is not requested again.
+
+    Args:
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+    """
+    http_adapter.register_uri("GET", "/app/status", json={"cpu": {"highPriority": 0.95}, "replicas": 1})
+    put = http_adapter.register_uri("PUT", "/app/replicas", status_code=204)
+    # Poll again right away rather than waiting out the cooldown
+    auto_scaler.cooldown_period = 0
+
+    auto_scaler.run_once = True
+    auto_scaler.run()
+    auto_scaler.run()
+
+    assert put.call_count == 1
+    assert put.last_request.json() == {"replicas": 2}
+
+
+@pytest.mark.parametrize(
+    "statuses, expected_puts",
+    [
+        # The application reached 2 replicas, then fell back to 1 while overloaded
+        ([(1, 0.95), (2, 0.80), (1, 0.95)], [2, 2]),
+        # The application was scaled elsewhere to 5 replicas before ever reporting the requested 3
+        ([(2, 0.95), (5, 0.45)], [3, 3]),
+        # The application still reports the old count, so the pending request is not sent again
+        ([(1, 0.95), (1, 0.95)], [2]),
+    ],
+)
+def test_auto_scaler_resends_after_drift(auto_scaler, http_adapter, statuses, expected_puts):
+    """
+    Test that the AutoScaler only suppresses a repeated replica count while the application has not yet moved off the count it reported when the request
+    was sent, and sends it again once the application drifts away from it.
+
+    Args:
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+        statuses (list): The (replicas, CPU usage) reported by successive polls.
+        expected_puts (list): The replica counts expected to be requested, in order.
+    """
+    auto_scaler.cooldown_period = 0
+    http_adapter.register_uri("GET", "/app/status", [{"json": {"cpu": {"highPriority": cpu}, "replicas": replicas}} for replicas, cpu in statuses])
+    put = http_adapter.register_uri("PUT", "/app/replicas", status_code=204)
+
+    auto_scaler.run_once = True
+    for _ in statuses:
+        auto_scaler.run()
+
+    assert [request.json()["replicas"] for request in put.request_history] == expected_puts
+
+
+def test_auto_scaler_pending_request_expires(mocker, auto_scaler, http_adapter):
+    """
+    Test that a pending replica count is sent again if the application still has not applied it one polling interval after the cooldown.
+
+    Args:
+        mocker: Pytest fixture for mocking.
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+    """
+    auto_scaler.cooldown_period = 60
+    http_adapter.register_uri("GET", "/app/status", json={"cpu": {"highPriority": 0.95}, "replicas": 1})
+    put = http_adapter.register_uri("PUT", "/app/replicas", status_code=204)
+    clock = [1000.0]
+    mocker.patch("time.monotonic", side_effect=lambda: clock[0])
+    auto_scaler.run_once = True
+
+    auto_scaler.run()
+    # First poll after the cooldown: the application may still be applying the change
+    clock[0] += 61
+    auto_scaler.run()
+    assert put.call_count == 1
+
+    # One polling interval later the request is considered lost and is sent again
+    clock[0] += 15
+    auto_scaler.run()
+    assert put.call_count == 2
 
 
-def test_get_current_status_server_error(mocker, mock_config):
+def test_auto_scaler_skips_polls_during_cooldown(mocker, auto_scaler, http_adapter):
+    """
+    Test that the AutoScaler does not poll the application during the cooldown period after a successful scaling request, and resumes once it has elapsed.
+
+    Args:
+        mocker: Pytest fixture for mocking.
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+    """
+    auto_scaler.cooldown_period = 60
+    get = http_adapter.register_uri("GET", "/app/status", json={"cpu": {"highPriority": 0.95}, "replicas": 1})
+    put = http_adapter.register_uri("PUT", "/app/replicas", status_code=204)
+    clock = [1000.0]
+    mocker.patch("time.monotonic", side_effect=lambda: clock[0])
+    auto_scaler.run_once = True
+
+    # Polls and scales up, starting the cooldown
+    auto_scaler.run()
+    assert get.call_count == 1
+    assert put.call_count == 1
+
+    # 30 seconds later the new replica is still starting, so the application is not polled
+    clock[0] += 30
+    auto_scaler.run()
+    assert get.call_count == 1
+
+    # Once the cooldown has elapsed, polling resumes
+    clock[0] += 31
+    auto_scaler.run()
+    assert get.call_count == 2
+
+
+def test_iteration_logged_as_single_json_record(auto_scaler, http_adapter, caplog):
+    """
+    Test that each polling iteration emits one log record whose fields render as a single JSON line with the application's log handler.
+
+    Args:
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+        caplog: Pytest fixture for capturing log output.
+    """
+    caplog.set_level(logging.INFO)
+    http_adapter.register_uri("GET", "/app/status", json={"cpu": {"highPriority": 0.80}, "replicas": 3})
+
+    auto_scaler.run_once = True
+    auto_scaler.run()
+
+    assert len(caplog.records) == 1
+    line = json_log_handler().format(caplog.records[0])
+    assert "\n" not in line
+    assert json.loads(line) == {"asctime": ANY, "levelname": "INFO", "message": "iteration", "cpu": 0.80, "replicas": 3, "new_replicas": 3}
+
+
+def test_get_current_status_server_error(auto_scaler, http_adapter):
     """
     Test the AutoScaler's handling of an error response when getting the current status.
     This test ensures that the AutoScaler correctly handles server errors by returning None.
 
     Args:
-        mocker: Pytest fixture for mocking.
-        mock_config: Mock configuration object for the AutoScaler.
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
     """
-    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay)
-    mocker.patch("requests.get", return_value=Mock(status_code=500, text="error retrieving status"))
+    http_adapter.register_uri("GET", "/app/status", status_code=500, text="error retrieving status")
 
     response = auto_scaler.get_current_status()
     assert response is None
 
 
-def test_set_replica_count_server_error(mocker, mock_config, caplog):
+def test_get_current_status_invalid_json(auto_scaler, http_adapter, caplog):
+    """
+    Test the AutoScaler's handling of a successful status response whose body is not JSON, such as an error page served by a proxy.
+    This test ensures that the failure is logged and the polling loop keeps running instead of raising.
+
+    Args:
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+        caplog: Pytest fixture for capturing log output.
+    """
+    http_adapter.register_uri("GET", "/app/status", status_code=200, text="<html>Bad Gateway</html>")
+    put = http_adapter.register_uri("PUT", "/app/replicas", status_code=204)
+
+    assert auto_scaler.get_current_status() is None
+
+    auto_scaler.run_once = True
+    auto_scaler.run()
+    assert not put.called
+    failures = [record for record in caplog.records if record.getMessage() == "request failed"]
+    assert [(record.verb, record.status) for record in failures] == [("GET", 200), ("GET", 200)]
+
+
+def test_set_replica_count_server_error(auto_scaler, http_adapter, caplog):
     """
     Test the AutoScaler's handling of an error response when setting the replica count.
     This test checks if the appropriate error message is logged when an error occurs.
 
     Args:
-        mocker: Pytest fixture for mocking.
-        mock_config: Mock configuration object for the AutoScaler.
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
         caplog: Pytest fixture for capturing log output.
     """
-    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay)
-    mocker.patch("requests.put", return_value=Mock(status_code=500, text="error updating replicas"))
+    http_adapter.register_uri("PUT", "/app/replicas", status_code=500, text="error updating replicas")
 
     auto_scaler.set_replica_count(10)
-    assert "error updating replicas" in caplog.text
+    failures = [record for record in caplog.records if record.getMessage() == "request failed"]
+    assert [(record.verb, record.status, record.body) for record in failures] == [("PUT", 500, "error updating replicas")]
+
+
+def test_session_retries_server_errors(mock_config, caplog):
+    """
+    Test that the session's retry adapter retries server errors, including a 503 with Retry-After, until the application responds successfully.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+        caplog: Pytest fixture for capturing log output.
+    """
+    responses = [(503, {"Retry-After": "0"}), (500, {}), (200, {"Content-Type": "application/json"})]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, headers = responses.pop(0)
+            body = json.dumps({"cpu": {"highPriority": 0.5}, "replicas": 2}).encode() if status == 200 else b"unavailable"
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        auto_scaler = AutoScaler("127.0.0.1", server.server_address[1], False, mock_config.target_cpu_usage, mock_config.polling_interval, 3, 0)
+        assert auto_scaler.get_current_status() == {"cpu": {"highPriority": 0.5}, "replicas": 2}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert responses == []
+    # urllib3 treats an immediate Retry-After like a missing one and falls back to the backoff, so both retries are logged without waiting
+    retries = [record for record in caplog.records if record.getMessage() == "retry"]
+    assert [(record.verb, record.attempt, record.status, record.delay) for record in retries] == [("GET", 1, 503, 0), ("GET", 2, 500, 0)]
+
+
+def test_backoff_delay_is_jittered_and_capped(mocker, mock_config):
+    """
+    Test the AutoScaler's retry backoff.
+    This test checks that every retry delay falls between zero and the exponential backoff value, never exceeding max_backoff.
+
+    Args:
+        mocker: Pytest fixture for mocking.
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, 6, 10, max_backoff=60)
+    mock_uniform = mocker.patch("random.uniform", side_effect=lambda low, high: high)
+
+    delays = [auto_scaler.backoff_delay(attempts) for attempts in range(1, 7)]
+
+    assert delays == [10, 60, 60, 60, 60, 60]
+    for call in mock_uniform.call_args_list:
+        assert call.args[0] == 0
+
+
+@pytest.mark.parametrize("retry_delay, retry_count, expected", [(1, 4, [1, 2, 4, 8]), (2, 6, [2, 4, 8, 16, 32, 60]), (10, 6, [10, 60, 60, 60, 60, 60]), (100, 2, [60, 60])])
+def test_backoff_table_grows_and_is_bounded(mock_config, retry_delay, retry_count, expected):
+    """
+    Test the precomputed backoff table.
+    This test checks that the backoff ceilings grow even when retry_delay is 1 and never exceed max_backoff.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+        retry_delay (int): The configured delay between retries.
+        retry_count (int): The configured number of retries.
+        expected (list): The expected backoff ceilings.
+    """
+    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, retry_count, retry_delay, max_backoff=60)
+    assert auto_scaler._backoffs == expected
 
 
 def test_handle_sigterm(mock_config):
@@ -141,6 +464,264 @@ def test_handle_sigterm(mock_config):
     assert auto_scaler.stop_requested
 
 
+def test_session_reused_across_polls(mocker, auto_scaler, http_adapter):
+    """
+    Test that the AutoScaler issues every poll through its persistent session.
+    This test ensures that repeated status requests reuse the same session and the cached status URL rather than opening new connections.
+
+    Args:
+        mocker: Pytest fixture for mocking.
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+    """
+    get = http_adapter.register_uri("GET", "/app/status", json={"cpu": {"highPriority": 0.80}, "replicas": 1})
+    module_get = mocker.patch("requests.get")
+
+    auto_scaler.get_current_status()
+    auto_scaler.get_current_status()
+
+    assert get.call_count == 2
+    assert get.last_request.url == auto_scaler.construct_url("/app/status")
+    assert get.last_request.headers["Accept"] == "application/json"
+    module_get.assert_not_called()
+
+
+def test_polling_schedule_corrects_drift(mocker, mock_config):
+    """
+    Test that the wait between polls subtracts the time spent polling, and that the schedule restarts when the AutoScaler falls more than an interval behind.
+
+    Args:
+        mocker: Pytest fixture for mocking.
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, 15, mock_config.retry_count, mock_config.retry_delay)
+    mocker.patch("time.monotonic", side_effect=[103.0, 150.0])
+
+    # The poll scheduled at 100 took 3 seconds, so only 12 seconds remain until the poll at 115
+    auto_scaler._next_tick = 100.0
+    assert auto_scaler._time_until_next_poll() == 12.0
+
+    # Polling from 115 to 150 overran the next slot, so the next poll is due now and the schedule restarts from 150
+    assert auto_scaler._time_until_next_poll() == 0
+    assert auto_scaler._next_tick == 150.0
+
+
+def test_request_stop_interrupts_polling_wait(auto_scaler, http_adapter):
+    """
+    Test that requesting a stop ends the wait between polls immediately.
+    The test requests a stop from another thread while the AutoScaler waits out a long polling interval and verifies that run returns promptly.
+
+    Args:
+        auto_scaler: AutoScaler served by the requests-mock adapter.
+        http_adapter: The requests-mock adapter emulating the application.
+    """
+    auto_scaler.polling_interval = 300
+    http_adapter.register_uri("GET", "/app/status", json={"cpu": {"highPriority": 0.80}, "replicas": 1})
+
+    stopper = threading.Timer(0.1, auto_scaler.request_stop)
+    stopper.start()
+    started = time.monotonic()
+    auto_scaler.run()
+
+    assert time.monotonic() - started < 5
+    assert auto_scaler.stop_requested
+
+
+def serve_app(status_payload, received):
+    """
+    Builds an aiohttp application emulating the status and replicas endpoints of the scaled application.
+
+    Args:
+        status_payload (dict): The JSON payload returned by the status endpoint.
+        received (list): A list that collects the JSON bodies of the replica updates.
+
+    Returns:
+        web.Application: The emulated application.
+    """
+
+    async def status(request):
+        return web.json_response(status_payload)
+
+    async def replicas(request):
+        received.append(await request.json())
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_get("/app/status", status)
+    app.router.add_put("/app/replicas", replicas)
+    return app
+
+
+def test_run_async_adjusts_replicas(mock_config):
+    """
+    Test the AutoScaler's asynchronous run loop against an emulated application.
+    The test checks that run_async reads the status and requests one more replica when the CPU usage is above target.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+    received = []
+
+    async def scenario():
+        async with TestServer(serve_app({"cpu": {"highPriority": 0.95}, "replicas": 1}, received), host="127.0.0.1") as server:
+            auto_scaler = AutoScaler("127.0.0.1", server.port, False, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay)
+            auto_scaler.run_once = True
+            await auto_scaler.run_async()
+
+    asyncio.run(scenario())
+    assert received == [{"replicas": 2}]
+
+
+def test_request_stop_interrupts_run_async(mock_config):
+    """
+    Test that requesting a stop from another thread ends the asynchronous run loop immediately.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+    received = []
+
+    async def scenario():
+        async with TestServer(serve_app({"cpu": {"highPriority": 0.80}, "replicas": 1}, received), host="127.0.0.1") as server:
+            auto_scaler = AutoScaler("127.0.0.1", server.port, False, mock_config.target_cpu_usage, 300, mock_config.retry_count, mock_config.retry_delay)
+            threading.Timer(0.2, auto_scaler.request_stop).start()
+            started = time.monotonic()
+            await auto_scaler.run_async()
+            return time.monotonic() - started
+
+    assert asyncio.run(scenario()) < 5
+    assert received == []
+
+
+def test_multi_auto_scaler_scales_each_target(mock_config):
+    """
+    Test that the MultiAutoScaler polls every target concurrently and adjusts each one according to its own CPU usage.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+    busy, idle = [], []
+
+    async def scenario():
+        async with TestServer(serve_app({"cpu": {"highPriority": 0.95}, "replicas": 2}, busy), host="127.0.0.1") as busy_server, TestServer(serve_app({"cpu": {"highPriority": 0.10}, "replicas": 2}, idle), host="127.0.0.1") as idle_server:
+            targets = [AutoScaler("127.0.0.1", server.port, False, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay) for server in (busy_server, idle_server)]
+            for target in targets:
+                target.run_once = True
+            await MultiAutoScaler(targets, concurrency=2).run()
+
+    asyncio.run(scenario())
+    assert busy == [{"replicas": 3}]
+    assert idle == [{"replicas": 1}]
+
+
+def test_multi_auto_scaler_isolates_failing_target(mock_config):
+    """
+    Test that a target returning a malformed status does not stop the MultiAutoScaler from adjusting the other targets.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+    broken, busy = [], []
+
+    async def scenario():
+        async with TestServer(serve_app({"cpu": {}, "replicas": 2}, broken), host="127.0.0.1") as broken_server, TestServer(serve_app({"cpu": {"highPriority": 0.95}, "replicas": 2}, busy), host="127.0.0.1") as busy_server:
+            targets = [AutoScaler("127.0.0.1", server.port, False, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay) for server in (broken_server, busy_server)]
+            for target in targets:
+                target.run_once = True
+            await MultiAutoScaler(targets, concurrency=2).run()
+
+    asyncio.run(scenario())
+    assert broken == []
+    assert busy == [{"replicas": 3}]
+
+
+@pytest.mark.parametrize("responses, expected_attempts, expected_retries", [
+    ([(404, {})], 1, []),
+    ([(429, {})], 1, []),
+    ([(429, {"Retry-After": "0"}), (200, {})], 2, [(429, 0)]),
+    ([(503, {"Retry-After": "0"}), (200, {})], 2, [(503, 0)]),
+    ([(500, {}), (200, {})], 2, [(500, 0.5)]),
+    ([(500, {}), (502, {}), (504, {})], 3, [(500, 0.5), (502, 0.5)]),
+    ([(200, {"Content-Type": "text/html"}), (200, {})], 2, [(200, 0.5)]),
+])
+def test_get_status_async_follows_retry_policy(mocker, mock_config, caplog, responses, expected_attempts, expected_retries):
+    """
+    Test that the asynchronous status request retries the same statuses as the session's retry adapter and honours Retry-After.
+
+    Args:
+        mocker: Pytest fixture for mocking.
+        mock_config: Mock configuration object for the AutoScaler.
+        caplog: Pytest fixture for capturing log output.
+        responses (list): The status and headers of each response served, in order; a 200 with headers serves a body that is not JSON.
+        expected_attempts (int): The expected number of requests made.
+        expected_retries (list): The expected status and delay of each logged retry.
+    """
+    served = list(responses)
+    payload = {"cpu": {"highPriority": 0.5}, "replicas": 2}
+
+    async def status(request):
+        code, headers = served.pop(0)
+        if code == 200 and not headers:
+            return web.json_response(payload)
+        return web.Response(status=code, headers=headers, text="unavailable")
+
+    app = web.Application()
+    app.router.add_get("/app/status", status)
+
+    async def scenario():
+        async with TestServer(app, host="127.0.0.1") as server, client_session(1) as session:
+            auto_scaler = AutoScaler("127.0.0.1", server.port, False, mock_config.target_cpu_usage, mock_config.polling_interval, 3, mock_config.retry_delay)
+            mocker.patch.object(auto_scaler, "backoff_delay", return_value=0.5)
+            mocker.patch("asyncio.sleep", return_value=None)
+            return await auto_scaler._get_status_async(session, asyncio.Semaphore(1))
+
+    result = asyncio.run(scenario())
+    assert result == (payload if responses[-1][0] == 200 else None)
+    assert len(responses) - len(served) == expected_attempts
+    retries = [record for record in caplog.records if record.getMessage() == "retry"]
+    assert [(record.status, record.delay) for record in retries] == expected_retries
+
+
+def test_retry_after_is_capped(mock_config):
+    """
+    Test that a Retry-After delay longer than max_backoff is capped in both the synchronous and asynchronous retry policies.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+    auto_scaler = AutoScaler(mock_config.host, mock_config.port, mock_config.use_https, mock_config.target_cpu_usage, mock_config.polling_interval, mock_config.retry_count, mock_config.retry_delay, max_backoff=60)
+
+    assert auto_scaler._async_retry_delay("GET", 1, 503, "86400") == 60
+    assert auto_scaler._async_retry_delay("GET", 1, 503, "5") == 5
+    assert auto_scaler._retry.get_retry_after(SimpleNamespace(headers={"Retry-After": "86400"})) == 60
+    assert auto_scaler._retry.new(total=1).get_retry_after(SimpleNamespace(headers={"Retry-After": "86400"})) == 60
+
+
+def test_request_stop_interrupts_retry_wait(mock_config):
+    """
+    Test that requesting a stop while the asynchronous loop waits to retry a failed request ends the loop immediately.
+
+    Args:
+        mock_config: Mock configuration object for the AutoScaler.
+    """
+
+    async def status(request):
+        return web.Response(status=503, headers={"Retry-After": "86400"}, text="unavailable")
+
+    app = web.Application()
+    app.router.add_get("/app/status", status)
+
+    async def scenario():
+        async with TestServer(app, host="127.0.0.1") as server:
+            auto_scaler = AutoScaler("127.0.0.1", server.port, False, mock_config.target_cpu_usage, 300, mock_config.retry_count, mock_config.retry_delay)
+            threading.Timer(0.2, auto_scaler.request_stop).start()
+            started = time.monotonic()
+            await auto_scaler.run_async()
+            return time.monotonic() - started
+
+    assert asyncio.run(scenario()) < 5
+
+
 def test_valid_arguments():
     """
     Test the parse_arguments function with valid arguments.
@@ -165,6 +746,23 @@ def test_invalid_ip_argument():
         parse_arguments()
 
 
+@pytest.mark.parametrize("ip, expected", [("localhost", True), ("host.docker.internal", True), ("127.0.0.1", True), ("255.255.255.255", True), ("::1", True), ("256.0.0.1", False), ("01.2.3.4", False), ("127.0.0.1\n", False), ("invalid_ip", False)])
+def test_is_valid_ip_address(ip, expected):
+    """
+    Test the is_valid_ip_address function with special host names, IPv4 and IPv6 addresses, and malformed values.
+    """
+    assert is_valid_ip_address(ip) is expected
+
+
+@pytest.mark.parametrize("replica_args", [["--min-replicas", "0"], ["--min-replicas", "6", "--max-replicas", "5"]])
+def test_invalid_replica_arguments(replica_args):
+    """
+    Test the parse_arguments function with a minimum replica count below 1 or above the maximum.
+    """
+    with patch.object(sys, "argv", ["autoscaler.py", *replica_args]), pytest.raises(SystemExit):
+        parse_arguments()
+
+
 def test_invalid_port_argument():
     """
     Test the parse_arguments function with an invalid port argument.